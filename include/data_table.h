@@ -28,6 +28,10 @@ public:
     // Delete point by id (returns false if not found)
     bool delete_point(int id);
 
+    // Delete every point in the table (returns false on SQL error)
+    // Used by the test-mode state reset; an empty table is not an error.
+    bool delete_all_points();
+
     // Update point's target value (returns false if not found)
     bool update_point_target(int id, const std::string& new_target);
 
@@ -48,6 +48,11 @@ bool DataTable::delete_point(int id) {
     return rc == SQLITE_DONE && changes > 0;
 }
 
+bool DataTable::delete_all_points() {
+    std::string sql = "DELETE FROM " + table_name_;
+    return db_.execute(sql);
+}
+
 bool DataTable::update_point_target(int id, const std::string& new_target) {
     sqlite3_stmt* stmt = nullptr;
     std::string sql = "UPDATE " + table_name_ + " SET target = ? WHERE id = ?";
@@ -1,4 +1,5 @@
 #include "database.h"
+#include <cstdlib>
 #include <iostream>
 #include <regex>
 
@@ -13,6 +14,15 @@ Database::Database(const std::string& db_path) : db_path_(db_path), db_(nullptr)
             sqlite3_close(db_);
             db_ = nullptr;
         }
+        return;
+    }
+
+    // Test harness opt-in: trade durability for speed. Scratch databases
+    // are throwaway, so skipping fsync and keeping the journal in memory
+    // is safe there and markedly faster on slow filesystems.
+    if (std::getenv("DATAPAINTER_TEST_FAST_SQLITE") != nullptr) {
+        execute("PRAGMA synchronous=OFF");
+        execute("PRAGMA journal_mode=MEMORY");
     }
 }
 
@@ -0,0 +1,91 @@
+"""Shared fixtures for the DataPainter integration tests."""
+
+import shutil
+
+import pytest
+
+from tui_test_framework import (DataPainterTest, resolve_datapainter_path,
+                                run_datapainter_command)
+
+
+@pytest.fixture(scope="session")
+def datapainter_binary():
+    """Absolute path to the datapainter binary, resolved once per session."""
+    return resolve_datapainter_path()
+
+
+@pytest.fixture(scope="session")
+def make_template_db(tmp_path_factory, datapainter_binary):
+    """Factory for template databases, one per distinct coordinate range.
+
+    Creating a table forks the binary and runs the SQLite schema, which
+    dominates the setup of tests needing a private on-disk database. The
+    returned callable builds a template for the requested range on first
+    use and caches it for the rest of the session; tests shutil.copyfile
+    the template instead of re-running --create-table.
+    """
+    base = tmp_path_factory.mktemp("templates")
+    templates = {}
+
+    def build(min_x='-10', max_x='10', min_y='-10', max_y='10',
+              table='test_table'):
+        key = (min_x, max_x, min_y, max_y, table)
+        if key not in templates:
+            path = base / f"template_{len(templates)}.db"
+            run_datapainter_command(datapainter_binary, [
+                '--database', str(path),
+                '--create-table',
+                '--table', table,
+                '--target-column-name', 'label',
+                '--x-axis-name', 'x',
+                '--y-axis-name', 'y',
+                '--x-meaning', 'positive',
+                '--o-meaning', 'negative',
+                '--min-x', min_x,
+                '--max-x', max_x,
+                '--min-y', min_y,
+                '--max-y', max_y
+            ])
+            templates[key] = path
+        return templates[key]
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def template_db(make_template_db):
+    """The standard-range (-10..10) template database."""
+    return make_template_db()
+
+
+@pytest.fixture
+def fresh_db(template_db, tmp_path):
+    """A private, writable copy of the standard template database.
+
+    Copying the file costs microseconds against the tens of
+    milliseconds a per-test --create-table spawn would; tmp_path keeps
+    the copy isolated per test and per xdist worker.
+    """
+    dst = tmp_path / "fresh.db"
+    shutil.copyfile(template_db, dst)
+    return str(dst)
+
+
+@pytest.fixture(scope="class")
+def painter():
+    """One DataPainter process shared by every test in a class.
+
+    Spawning the TUI and waiting for the first render costs hundreds of
+    milliseconds per test; sharing the process amortizes that. Tests get a
+    pristine state via the fresh_painter fixture below.
+    """
+    with DataPainterTest(width=80, height=24) as test:
+        assert test.wait_ready(), "App should emit READY after first paint"
+        yield test
+
+
+@pytest.fixture
+def fresh_painter(painter):
+    """The shared painter process, reset to its startup state."""
+    assert painter.reset(), "Test-mode reset should clear the edit area"
+    return painter
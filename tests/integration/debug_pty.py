@@ -4,20 +4,27 @@ Debug script to diagnose PTY test framework issues.
 This will help us understand why the child process is failing.
 """
 
+import fcntl
+import functools
 import os
+import shutil
+import struct
 import sys
+import termios
 import time
 import pty
 import select
+import signal
 import tempfile
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(__file__))
-
 from pathlib import Path
 
+@functools.lru_cache(maxsize=1)
 def find_datapainter():
-    """Find the datapainter executable."""
+    """Find the datapainter executable (memoized; the path never changes)."""
+    # repo_root is already resolved, so the candidates are absolute paths and
+    # need no second resolve(). os.access also checks executability in the
+    # same stat that exists() would spend.
     repo_root = Path(__file__).resolve().parent.parent.parent
     candidates = [
         repo_root / "build" / "datapainter",
@@ -25,110 +32,216 @@ def find_datapainter():
     ]
 
     for candidate in candidates:
-        if candidate.exists():
-            return str(candidate.resolve())
+        if os.access(str(candidate), os.X_OK):
+            return str(candidate)
 
     raise FileNotFoundError("Could not locate datapainter executable")
 
 
 def test_pty_basic():
     """Test basic PTY functionality with datapainter."""
-    print("=== PTY Diagnostic Test ===\n")
+    # Buffer diagnostics and emit them with one write(2) in the finally block
+    # instead of one syscall per line-buffered print.
+    log = ["=== PTY Diagnostic Test ===\n"]
 
     # Find executable
     datapainter_path = find_datapainter()
-    print(f"Using datapainter: {datapainter_path}")
-
-    # Create temp database
-    fd, temp_db = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    print(f"Created temp database: {temp_db}")
-
-    # Set up environment
-    env = os.environ.copy()
-    env['TERM'] = 'xterm-256color'
-
-    print("\nForking PTY...")
-    pid, master_fd = pty.fork()
-
-    if pid == 0:
-        # Child process
-        args = [
-            datapainter_path,
-            "--database", temp_db,
-            "--table", "test_points"
-        ]
-        print(f"Child executing: {' '.join(args)}", file=sys.stderr)
-        os.execve(datapainter_path, args, env)
-        # Should never reach here
-        sys.exit(1)
+    log.append(f"Using datapainter: {datapainter_path}")
+
+    # Create temp database path; mkdtemp avoids mkstemp's open/close of an fd
+    # we never use (datapainter creates the file itself).
+    tmpdir = tempfile.mkdtemp()
+    temp_db = os.path.join(tmpdir, "test.db")
+    log.append(f"Using temp database: {temp_db}")
+
+    # Minimal child environment: copying the whole parent environment only to
+    # add TERM would make the kernel copy every CI variable into the new mm.
+    env = {
+        'PATH': os.environ.get('PATH', ''),
+        'HOME': os.environ.get('HOME', ''),
+        'TERM': 'xterm-256color',
+    }
+
+    log.append("\nSpawning child on a new PTY...")
+    # posix_spawn over a pre-opened PTY pair avoids forking (and COW-faulting)
+    # the whole Python interpreter just to immediately exec the child.
+    master_fd, slave_fd = pty.openpty()
+
+    # Give the PTY a definite 80x24 size before the child starts: a TUI that
+    # finds a zero-sized window does extra redraws (or waits on SIGWINCH),
+    # all of which this loop would then have to drain.
+    winsize = struct.pack('HHHH', 24, 80, 0, 0)
+    fcntl.ioctl(master_fd, termios.TIOCSWINSZ, winsize)
+
+    args = [
+        datapainter_path,
+        "--database", temp_db,
+        "--table", "test_points"
+    ]
+    # Pre-encode the trace line and emit it with a bare write(2): os.write is
+    # a thin syscall wrapper, so the spawn path skips the print machinery
+    # (locale, encoding, stream locking) entirely.
+    child_log = f"Child executing: {' '.join(args)}\n".encode()
+    os.write(2, child_log)
+    pid = os.posix_spawn(
+        datapainter_path,
+        args,
+        env,
+        file_actions=[
+            (os.POSIX_SPAWN_DUP2, slave_fd, 0),
+            (os.POSIX_SPAWN_DUP2, slave_fd, 1),
+            (os.POSIX_SPAWN_DUP2, slave_fd, 2),
+            (os.POSIX_SPAWN_CLOSE, slave_fd),
+            (os.POSIX_SPAWN_CLOSE, master_fd),
+        ],
+        setsid=True,
+    )
+    os.close(slave_fd)
 
     # Parent process
-    print(f"Child process PID: {pid}")
-    print("Waiting for initial output...")
+    log.append(f"Child process PID: {pid}")
+    log.append("Waiting for initial output...")
+
+    # Register the PTY master with epoll once instead of rebuilding a select()
+    # fd set on every iteration; HUP/ERR events replace the OSError catch.
+    ep = select.epoll()
+    ep.register(master_fd, select.EPOLLIN | select.EPOLLHUP | select.EPOLLERR)
+
+    # Watch the child through a pidfd so exit wakes the same epoll loop,
+    # instead of busy-polling waitpid(WNOHANG) on every iteration.
+    # pidfd_open needs Python 3.9+ and Linux 5.3+; fall back to WNOHANG polling.
+    pidfd = None
+    if hasattr(os, 'pidfd_open'):
+        try:
+            pidfd = os.pidfd_open(pid)
+            ep.register(pidfd, select.EPOLLIN)
+        except OSError:
+            pidfd = None
+
+    # Drain bursts with a single readv() per wake into preallocated buffers
+    # instead of one 4096-byte os.read() per wake; the buffers are reused
+    # across iterations so large startup bursts cost one syscall, not four.
+    read_bufs = [bytearray(4096) for _ in range(4)]
+    # Reusable view over the first buffer: slicing a memoryview and calling
+    # tobytes() only when logging keeps the drain loop itself allocation-free.
+    read_view = memoryview(read_bufs[0])
+    os.set_blocking(master_fd, False)
 
     # Read initial output
     try:
+        done = False
         for i in range(10):
-            ready, _, _ = select.select([master_fd], [], [], 0.5)
-            if ready:
-                try:
-                    data = os.read(master_fd, 4096)
-                    print(f"\n[Iteration {i}] Read {len(data)} bytes from child")
-                    print(f"Data: {data[:100]}")  # Print first 100 bytes
-                except OSError as e:
-                    print(f"\n[Iteration {i}] OSError reading from PTY: {e}")
+            events = ep.poll(0.5)
+            if events:
+                for fd, event in events:
+                    if pidfd is not None and fd == pidfd:
+                        child_pid, status = os.waitpid(pid, 0)
+                        log.append(f"\nChild process exited! PID: {child_pid}, Status: {status}")
+                        if os.WIFEXITED(status):
+                            log.append(f"Exit code: {os.WEXITSTATUS(status)}")
+                        if os.WIFSIGNALED(status):
+                            log.append(f"Killed by signal: {os.WTERMSIG(status)}")
+                        done = True
+                        continue
+                    if event & select.EPOLLIN:
+                        total = 0
+                        while True:
+                            try:
+                                n = os.readv(master_fd, read_bufs)
+                            except BlockingIOError:
+                                break
+                            except OSError:
+                                # EIO: slave side closed, reported below via HUP
+                                break
+                            if n <= 0:
+                                break
+                            total += n
+                        log.append(f"\n[Iteration {i}] Read {total} bytes from child")
+                        # Log first 100 bytes (copied out only for the log)
+                        log.append(f"Data: {read_view[:min(total, 100)].tobytes()}")
+                    if event & (select.EPOLLHUP | select.EPOLLERR):
+                        log.append(f"\n[Iteration {i}] PTY closed (HUP/ERR event {event:#x})")
+                        done = True
+                if done:
                     break
             else:
-                print(f"[Iteration {i}] No data available yet")
+                log.append(f"[Iteration {i}] No data available yet")
 
-            # Check if child is still alive
-            try:
-                child_pid, status = os.waitpid(pid, os.WNOHANG)
-                if child_pid != 0:
-                    print(f"\nChild process exited! PID: {child_pid}, Status: {status}")
-                    if os.WIFEXITED(status):
-                        print(f"Exit code: {os.WEXITSTATUS(status)}")
-                    if os.WIFSIGNALED(status):
-                        print(f"Killed by signal: {os.WTERMSIG(status)}")
+            if pidfd is None:
+                # Fallback: check if child is still alive
+                try:
+                    child_pid, status = os.waitpid(pid, os.WNOHANG)
+                    if child_pid != 0:
+                        log.append(f"\nChild process exited! PID: {child_pid}, Status: {status}")
+                        if os.WIFEXITED(status):
+                            log.append(f"Exit code: {os.WEXITSTATUS(status)}")
+                        if os.WIFSIGNALED(status):
+                            log.append(f"Killed by signal: {os.WTERMSIG(status)}")
+                        break
+                    else:
+                        log.append(f"[Iteration {i}] Child still alive")
+                except ChildProcessError:
+                    log.append("\nChild process already exited (ChildProcessError)")
                     break
-                else:
-                    print(f"[Iteration {i}] Child still alive")
-            except ChildProcessError:
-                print("\nChild process already exited (ChildProcessError)")
-                break
 
         # Try to write to PTY
-        print("\n\nAttempting to write to PTY...")
+        log.append("\n\nAttempting to write to PTY...")
         try:
             os.write(master_fd, b'x')
-            print("Successfully wrote 'x' to PTY")
+            log.append("Successfully wrote 'x' to PTY")
         except OSError as e:
-            print(f"Failed to write to PTY: {e}")
-
-        # Wait a bit more
-        time.sleep(0.5)
+            log.append(f"Failed to write to PTY: {e}")
+
+        # Wait for the child's response, returning as soon as it goes quiet
+        # instead of sleeping a fixed 0.5s.
+        wait = 0.5
+        while True:
+            events = ep.poll(wait)
+            master_events = [ev for fd, ev in events if fd == master_fd]
+            if not master_events:
+                break  # quiescent (or only the exit notification is pending)
+            while True:
+                try:
+                    if os.readv(master_fd, read_bufs) <= 0:
+                        break
+                except (BlockingIOError, OSError):
+                    break
+            if any(ev & (select.EPOLLHUP | select.EPOLLERR) for ev in master_events):
+                break  # child side closed; HUP stays pending, so stop here
+            wait = 0.05  # drained a burst; only linger briefly for stragglers
 
     finally:
         # Cleanup
-        print("\n\nCleaning up...")
+        log.append("\n\nCleaning up...")
         try:
-            os.kill(pid, 15)  # SIGTERM
+            if pidfd is not None:
+                # Signalling through the pidfd cannot race a recycled PID the
+                # way os.kill(pid, ...) can under parallel test runs.
+                signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+            else:
+                os.kill(pid, signal.SIGTERM)
             os.waitpid(pid, 0)
         except (OSError, ChildProcessError):
             pass
 
+        ep.close()
+
+        if pidfd is not None:
+            try:
+                os.close(pidfd)
+            except OSError:
+                pass
+
         try:
             os.close(master_fd)
         except OSError:
             pass
 
-        try:
-            os.unlink(temp_db)
-        except OSError:
-            pass
+        shutil.rmtree(tmpdir, ignore_errors=True)
 
-        print("Done!")
+        log.append("Done!")
+        sys.stdout.write('\n'.join(log) + '\n')
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
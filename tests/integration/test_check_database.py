@@ -3,76 +3,42 @@ Test to check what's in the database after deletion.
 """
 
 import sqlite3
-import time
-import tempfile
-import os
-from pathlib import Path
-from tui_test_framework import DataPainterTest
+from tui_test_framework import DataPainterTest, wait_for_db
 
 
-def test_check_unsaved_changes_table():
+def test_check_unsaved_changes_table(fresh_db):
     """Check what's actually in unsaved_changes table after deletion."""
-    # Create a persistent temp database so we can examine it
-    fd, temp_db = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-
-    try:
-        # Initialize the database first (required when passing custom database_path)
-        import subprocess
-        repo_root = Path(__file__).parent.parent.parent
-        datapainter_path = str(repo_root / 'build' / 'datapainter')
-        subprocess.run([
-            datapainter_path,
-            '--database', temp_db,
-            '--create-table',
-            '--table', 'test_table',
-            '--target-column-name', 'label',
-            '--x-axis-name', 'x',
-            '--y-axis-name', 'y',
-            '--x-meaning', 'positive',
-            '--o-meaning', 'negative',
-            '--min-x', '-10',
-            '--max-x', '10',
-            '--min-y', '-10',
-            '--max-y', '10'
-        ], check=True, capture_output=True)
-
-        with DataPainterTest(width=80, height=24, database_path=temp_db) as test:
-            # Wait for UI
-            test.wait_for_text('test_table', timeout=3.0)
-
-            # Create a point
-            test.send_keys('x')
-            time.sleep(0.3)
-
-            # Check database before deletion
-            conn = sqlite3.connect(temp_db)
+    with DataPainterTest(width=80, height=24, database_path=fresh_db) as test:
+        # Wait for UI
+        test.wait_for_text('test_table', timeout=3.0)
+
+        # Create a point and wait for it to reach unsaved_changes
+        test.send_keys('x')
+        assert wait_for_db(fresh_db, lambda c: c.execute(
+            "SELECT COUNT(*) FROM unsaved_changes WHERE is_active = 1"
+        ).fetchone()[0] == 1), "Point should land in unsaved_changes"
+
+        # One read-only connection serves both snapshots: each statement
+        # on it starts a fresh read transaction, so it sees the app's
+        # commits without ever taking the writer lock
+        conn = sqlite3.connect(f"file:{fresh_db}?mode=ro", uri=True)
+        try:
             cursor = conn.cursor()
 
             print("\n=== After creating point 'x' ===")
-            cursor.execute("SELECT * FROM unsaved_changes")
-            for row in cursor.fetchall():
+            cursor.execute("SELECT id, action, data_id, x, y, new_target, is_active FROM unsaved_changes")
+            for row in cursor:
                 print(row)
 
-            conn.close()
-
-            # Delete the point
+            # Delete the point and wait for the change to be deactivated
             test.send_keys('BACKSPACE')
-            time.sleep(0.3)
-
-            # Check database after deletion
-            conn = sqlite3.connect(temp_db)
-            cursor = conn.cursor()
+            assert wait_for_db(fresh_db, lambda c: c.execute(
+                "SELECT COUNT(*) FROM unsaved_changes WHERE is_active = 1"
+            ).fetchone()[0] == 0), "Deletion should deactivate the insert"
 
             print("\n=== After pressing BACKSPACE ===")
             cursor.execute("SELECT id, action, data_id, x, y, new_target, is_active FROM unsaved_changes")
-            for row in cursor.fetchall():
+            for row in cursor:
                 print(f"id={row[0]}, action={row[1]}, data_id={row[2]}, x={row[3]}, y={row[4]}, target={row[5]}, is_active={row[6]}")
-
+        finally:
             conn.close()
-    finally:
-        os.unlink(temp_db)
-
-
-if __name__ == '__main__':
-    test_check_unsaved_changes_table()
@@ -2,38 +2,31 @@
 Debug test to understand deletion behavior.
 """
 
-import time
 from tui_test_framework import DataPainterTest
 
 
+def _dump(test, heading):
+    print(f"\n=== {heading} ===")
+    for i, line in enumerate(test.get_display_lines()):
+        print(f"{i:2d} |{line}|")
+
+
 def test_debug_deletion_verbose():
     """Debug test to see exactly what's happening with deletion."""
     with DataPainterTest(width=80, height=24) as test:
         # Wait for UI
         test.wait_for_text('test_table', timeout=3.0)
+        _dump(test, "Initial state")
 
-        print("\n=== Initial state ===")
-        lines = test.get_display_lines()
-        for i, line in enumerate(lines):
-            print(f"{i:2d} |{line}|")
-
-        # Create a point
-        print("\n=== Creating point with 'x' ===")
-        test.send_keys('x')
-        time.sleep(0.3)
+        # Create a point and wait for it to render
+        test.press_and_wait_for('x', 'xX')
+        _dump(test, "After creating point with 'x'")
 
-        lines = test.get_display_lines()
-        for i, line in enumerate(lines):
-            print(f"{i:2d} |{line}|")
-
-        # Try to delete
-        print("\n=== Pressing BACKSPACE ===")
+        # Try to delete; wait for the resulting redraw to settle instead
+        # of sleeping a fixed delay
         test.send_keys('BACKSPACE')
-        time.sleep(0.3)
-
-        lines = test.get_display_lines()
-        for i, line in enumerate(lines):
-            print(f"{i:2d} |{line}|")
+        test.wait_for_idle()
+        _dump(test, "After pressing BACKSPACE")
 
 
 if __name__ == '__main__':
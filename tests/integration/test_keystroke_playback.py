@@ -5,218 +5,107 @@ Tests the --keystroke-file CLI argument that allows automated testing
 by replaying keystrokes from a file instead of reading from terminal.
 """
 
-import os
-import subprocess
-import tempfile
+import shutil
 import sqlite3
-from pathlib import Path
+import subprocess
+
+import pytest
+
+from tui_test_framework import resolve_datapainter_path
 
+DATAPAINTER = resolve_datapainter_path()
 
-def setup_test_database():
-    """Create a temporary database with a test table."""
-    # Create temporary database file
-    fd, db_path = tempfile.mkstemp(suffix='.db')
-    os.close(fd)
 
-    # Get path to datapainter executable
-    repo_root = Path(__file__).parent.parent.parent
-    datapainter_exe = repo_root / "build" / "datapainter"
+@pytest.fixture
+def playback_db(make_template_db, tmp_path):
+    """A private copy of a template database with a 'test' table.
 
-    # Create test table using datapainter
-    result = subprocess.run([
-        str(datapainter_exe),
+    Every test here needs a valid table even on the error paths — the
+    binary resolves --table before it opens the keystroke file — so a
+    template copy replaces the per-test --create-table spawn.
+    """
+    dst = tmp_path / "playback.db"
+    shutil.copyfile(make_template_db(table='test'), dst)
+    return str(dst)
+
+
+def run_playback(db_path, keystroke_file):
+    """Run datapainter replaying the given keystroke file."""
+    return subprocess.run([
+        DATAPAINTER,
         "--database", db_path,
-        "--create-table",
         "--table", "test",
-        "--target-column-name", "label",
-        "--x-axis-name", "x",
-        "--y-axis-name", "y",
-        "--x-meaning", "positive",
-        "--o-meaning", "negative",
-        "--min-x", "-10",
-        "--max-x", "10",
-        "--min-y", "-10",
-        "--max-y", "10"
-    ], capture_output=True, text=True)
-
-    if result.returncode != 0:
-        os.unlink(db_path)
-        raise RuntimeError(f"Failed to create test table: {result.stderr}")
-
-    return db_path
-
-
-def cleanup_database(db_path):
-    """Remove temporary database."""
-    if os.path.exists(db_path):
-        os.unlink(db_path)
-
-
-def test_keystroke_playback_creates_points():
-    """Test that keystroke playback can create points."""
-    db_path = setup_test_database()
-
-    try:
-        # Create keystroke file
-        fd, keystroke_file = tempfile.mkstemp(suffix='.txt')
-        with os.fdopen(fd, 'w') as f:
-            f.write("# Move cursor and create points\n")
-            f.write("x\n")  # Create an x point at center
-            f.write("<right>\n")  # Move right
-            f.write("o\n")  # Create an o point
-            f.write("s\n")  # Save changes
-            f.write("q\n")  # Quit
-
-        # Get path to datapainter executable
-        repo_root = Path(__file__).parent.parent.parent
-        datapainter_exe = repo_root / "build" / "datapainter"
-
-        # Run datapainter with keystroke file
-        result = subprocess.run([
-            str(datapainter_exe),
-            "--database", db_path,
-            "--table", "test",
-            "--keystroke-file", keystroke_file,
-            "--override-screen-height", "20",
-            "--override-screen-width", "60"
-        ], capture_output=True, text=True, timeout=5)
-
-        # Clean up keystroke file
-        os.unlink(keystroke_file)
-
-        # Check that program exited successfully
-        assert result.returncode == 0, f"datapainter failed: {result.stderr}"
-
-        # Verify points were created in database
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT target FROM test ORDER BY id")
-        points = cursor.fetchall()
-        conn.close()
-
-        # Should have created 2 points (x and o)
-        assert len(points) == 2, f"Expected 2 points, got {len(points)}"
-        assert points[0][0] == "positive", "First point should be 'positive'"
-        assert points[1][0] == "negative", "Second point should be 'negative'"
-
-    finally:
-        cleanup_database(db_path)
-
-
-def test_keystroke_playback_invalid_file():
+        "--keystroke-file", str(keystroke_file),
+        "--override-screen-height", "20",
+        "--override-screen-width", "60"
+    ], capture_output=True, text=True, timeout=5)
+
+
+@pytest.mark.parametrize("keystrokes, expected_targets", [
+    pytest.param(
+        ["# Move cursor and create points",
+         "x",        # Create an x point at center
+         "<right>",  # Move right
+         "o",        # Create an o point
+         "s",        # Save changes
+         "q"],       # Quit
+        ["positive", "negative"],
+        id='creates-points'),
+    pytest.param(
+        ["# Test special keys",
+         "x",        # Create point
+         "<up>",     # Move up
+         "<up>",
+         "o",        # Create another point
+         "<down>",   # Move down
+         "<left>",   # Move left
+         "x",        # Create another point
+         "s",        # Save changes
+         "q"],       # Quit
+        ["positive", "negative", "positive"],
+        id='special-keys'),
+])
+def test_keystroke_playback_creates_points(playback_db, tmp_path,
+                                           keystrokes, expected_targets):
+    """Replay a keystroke file and verify the points it should create."""
+    keystroke_file = tmp_path / "keys.txt"
+    keystroke_file.write_text("".join(line + "\n" for line in keystrokes))
+
+    result = run_playback(playback_db, keystroke_file)
+    assert result.returncode == 0, f"datapainter failed: {result.stderr}"
+
+    # Verify points were created in database, in creation order
+    conn = sqlite3.connect(f"file:{playback_db}?mode=ro", uri=True)
+    cursor = conn.cursor()
+    cursor.execute("SELECT target FROM test ORDER BY id")
+    targets = [row[0] for row in cursor.fetchall()]
+    conn.close()
+
+    assert targets == expected_targets, \
+        f"Expected targets {expected_targets}, got {targets}"
+
+
+def test_keystroke_playback_invalid_file(playback_db):
     """Test that invalid keystroke file produces error."""
-    db_path = setup_test_database()
+    # Run datapainter with non-existent keystroke file
+    result = run_playback(playback_db, "/nonexistent/file.txt")
 
-    try:
-        # Get path to datapainter executable
-        repo_root = Path(__file__).parent.parent.parent
-        datapainter_exe = repo_root / "build" / "datapainter"
+    # Should fail with error exit code
+    assert result.returncode == 2, f"Expected exit code 2, got {result.returncode}"
 
-        # Run datapainter with non-existent keystroke file
-        result = subprocess.run([
-            str(datapainter_exe),
-            "--database", db_path,
-            "--table", "test",
-            "--keystroke-file", "/nonexistent/file.txt"
-        ], capture_output=True, text=True, timeout=5)
+    # Should report error about file
+    assert "Could not open file" in result.stderr, "Should report file error"
 
-        # Should fail with error exit code
-        assert result.returncode == 2, f"Expected exit code 2, got {result.returncode}"
 
-        # Should report error about file
-        assert "Could not open file" in result.stderr, "Should report file error"
+def test_keystroke_playback_empty_file(playback_db, tmp_path):
+    """Test that empty keystroke file produces error."""
+    keystroke_file = tmp_path / "empty.txt"
+    keystroke_file.touch()
 
-    finally:
-        cleanup_database(db_path)
+    result = run_playback(playback_db, keystroke_file)
 
+    # Should fail with error exit code
+    assert result.returncode == 2, f"Expected exit code 2, got {result.returncode}"
 
-def test_keystroke_playback_empty_file():
-    """Test that empty keystroke file produces error."""
-    db_path = setup_test_database()
-
-    try:
-        # Create empty keystroke file
-        fd, keystroke_file = tempfile.mkstemp(suffix='.txt')
-        os.close(fd)  # Close immediately, leaving file empty
-
-        # Get path to datapainter executable
-        repo_root = Path(__file__).parent.parent.parent
-        datapainter_exe = repo_root / "build" / "datapainter"
-
-        # Run datapainter with empty keystroke file
-        result = subprocess.run([
-            str(datapainter_exe),
-            "--database", db_path,
-            "--table", "test",
-            "--keystroke-file", keystroke_file
-        ], capture_output=True, text=True, timeout=5)
-
-        # Clean up keystroke file
-        os.unlink(keystroke_file)
-
-        # Should fail with error exit code
-        assert result.returncode == 2, f"Expected exit code 2, got {result.returncode}"
-
-        # Should report error about no keystrokes
-        assert "no valid keystrokes" in result.stderr, "Should report no keystrokes error"
-
-    finally:
-        cleanup_database(db_path)
-
-
-def test_keystroke_playback_with_special_keys():
-    """Test that special keys (arrow keys, space, etc.) work in keystroke playback."""
-    db_path = setup_test_database()
-
-    try:
-        # Create keystroke file with special keys
-        fd, keystroke_file = tempfile.mkstemp(suffix='.txt')
-        with os.fdopen(fd, 'w') as f:
-            f.write("# Test special keys\n")
-            f.write("x\n")  # Create point
-            f.write("<up>\n")  # Move up
-            f.write("<up>\n")
-            f.write("o\n")  # Create another point
-            f.write("<down>\n")  # Move down
-            f.write("<left>\n")  # Move left
-            f.write("x\n")  # Create another point
-            f.write("s\n")  # Save changes
-            f.write("q\n")  # Quit
-
-        # Get path to datapainter executable
-        repo_root = Path(__file__).parent.parent.parent
-        datapainter_exe = repo_root / "build" / "datapainter"
-
-        # Run datapainter with keystroke file
-        result = subprocess.run([
-            str(datapainter_exe),
-            "--database", db_path,
-            "--table", "test",
-            "--keystroke-file", keystroke_file,
-            "--override-screen-height", "20",
-            "--override-screen-width", "60"
-        ], capture_output=True, text=True, timeout=5)
-
-        # Clean up keystroke file
-        os.unlink(keystroke_file)
-
-        # Check that program exited successfully
-        assert result.returncode == 0, f"datapainter failed: {result.stderr}"
-
-        # Verify points were created
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM test")
-        count = cursor.fetchone()[0]
-        conn.close()
-
-        # Should have created 3 points
-        assert count == 3, f"Expected 3 points, got {count}"
-
-    finally:
-        cleanup_database(db_path)
-
-
-if __name__ == "__main__":
-    import pytest
-    pytest.main([__file__, "-v"])
+    # Should report error about no keystrokes
+    assert "no valid keystrokes" in result.stderr, "Should report no keystrokes error"
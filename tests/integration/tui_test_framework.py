@@ -10,16 +10,158 @@ This module provides utilities for testing terminal user interfaces by:
 
 import os
 import pty
-import select
+import re
+import sqlite3
+from collections import Counter
+import selectors
 import signal
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pyte
 
 
+class Snapshot:
+    """
+    Frozen view of the screen at one instant.
+
+    Holds the display rows (`lines`), the whole screen joined as one string
+    (`text`) and the edit-area content with borders excluded (`middle`).
+    pyte recomputes `display` from its cell buffer on every access, so tests
+    should take one Snapshot per wait-point and assert against that.
+
+    `count` runs over a lazily built NumPy view of the cells, so counting
+    several characters in a region is a single C-level pass instead of a
+    chain of Python-level str.count calls over freshly sliced substrings.
+    """
+
+    def __init__(self, lines: Tuple[str, ...], text: str, middle: str):
+        self.lines = lines
+        self.text = text
+        self.middle = middle
+        self._arr: Optional[np.ndarray] = None
+        self._counts: Optional[Counter] = None
+
+    @property
+    def counts(self) -> Counter:
+        """Per-character tallies over the edit area, computed once."""
+        if self._counts is None:
+            self._counts = Counter(self.middle)
+        return self._counts
+
+    @property
+    def arr(self) -> np.ndarray:
+        """Screen cells as a rows-by-cols array of single characters."""
+        if self._arr is None:
+            self._arr = np.array([list(line) for line in self.lines],
+                                 dtype='U1')
+        return self._arr
+
+    def count(self, chars: str,
+              rows: slice = slice(None), cols: slice = slice(None)) -> int:
+        """Count cells in a region matching any of `chars`."""
+        return int(np.isin(self.arr[rows, cols], list(chars)).sum())
+
+
+def scratch_db_dir() -> Optional[str]:
+    """Return a tmpfs directory for throwaway test databases, if available.
+
+    SQLite fsyncs on every commit, so putting scratch databases on /dev/shm
+    keeps disk latency out of test time. Returns None when tmpfs is not
+    usable (non-Linux, or /dev/shm not writable); callers then fall back to
+    the regular temp directory.
+    """
+    base = Path('/dev/shm')
+    if not (base.is_dir() and os.access(base, os.W_OK)):
+        return None
+    user = os.environ.get('USER') or str(os.getuid())
+    scratch = base / f'datapainter-tests-{user}'
+    try:
+        scratch.mkdir(exist_ok=True)
+    except OSError:
+        return None
+    return str(scratch)
+
+
+def wait_for_db(db_path: str, predicate, timeout: float = 5.0,
+                poll: float = 0.01) -> bool:
+    """Poll a database read-only until a predicate over a cursor holds.
+
+    Saves finish in milliseconds, so tests that verify database state
+    should wait on the state itself rather than sleeping a worst-case
+    delay; the generous timeout only matters on a heavily loaded
+    machine, where the app's commit can lag well behind the keypress.
+    The connection is opened in read-only mode per attempt so a
+    mid-save writer lock is retried instead of erroring the test.
+
+    Args:
+        db_path: Path to the SQLite database file
+        predicate: Callable taking a cursor, returning True when the
+                   awaited state is visible
+        timeout: Maximum time to wait in seconds
+        poll: Delay between attempts in seconds
+
+    Returns:
+        True if the predicate became true, False on timeout
+    """
+    end_time = time.time() + timeout
+    conn = None
+    try:
+        while True:
+            try:
+                if conn is None:
+                    # One connection for the whole wait; reparsing the DB
+                    # header every poll would dominate the fast path
+                    conn = sqlite3.connect(f"file:{db_path}?mode=ro",
+                                           uri=True)
+                if predicate(conn.cursor()):
+                    return True
+            except sqlite3.OperationalError:
+                # Database locked or still being created; retry below
+                pass
+            if time.time() >= end_time:
+                return False
+            time.sleep(poll)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def run_datapainter_command(binary: str, args: List[str],
+                            env: Optional[dict] = None) -> None:
+    """Run the datapainter binary for its side effect and wait for it.
+
+    Spawns via os.posix_spawn, which avoids forking the Python process --
+    relevant under pytest-xdist where each worker carries a sizeable
+    interpreter. These are one-shot setup commands (--create-table), so
+    stdout/stderr go to /dev/null; a non-zero exit raises.
+
+    Args:
+        binary: Absolute path to the datapainter executable
+        args: Command-line arguments (excluding argv[0])
+        env: Environment for the child; defaults to the current one
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        pid = os.posix_spawn(
+            binary, [binary] + args,
+            env if env is not None else os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, devnull, 1),
+                (os.POSIX_SPAWN_DUP2, devnull, 2),
+            ])
+    finally:
+        os.close(devnull)
+    _, status = os.waitpid(pid, 0)
+    if not (os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0):
+        raise RuntimeError(
+            f"datapainter {' '.join(args)} failed with status {status}")
+
+
 def resolve_datapainter_path(provided_path: Optional[str] = None) -> str:
     """Return an absolute path to the datapainter executable."""
 
@@ -78,7 +220,8 @@ class DataPainterTest:
     def __init__(self, width: int = 80, height: int = 24,
                  datapainter_path: Optional[str] = None,
                  database_path: Optional[str] = None,
-                 table_name: Optional[str] = None):
+                 table_name: Optional[str] = None,
+                 emulate_terminal: bool = True):
         """
         Initialize test harness.
 
@@ -88,21 +231,57 @@ class DataPainterTest:
             datapainter_path: Path to datapainter executable
             database_path: Path to test database (creates temp if None)
             table_name: Name of table to open (creates test_table if None)
+            emulate_terminal: Feed PTY output through pyte. Tests that never
+                inspect rendered glyphs (only "still running" / database
+                state) can pass False to skip emulation — pyte's stream
+                parsing is the most expensive part of the harness — and use
+                wait_for_idle/is_running instead of screen accessors.
         """
         self.width = width
         self.height = height
         self.datapainter_path = resolve_datapainter_path(datapainter_path)
         self.database_path = database_path
         self.table_name = table_name or "test_table"
+        self.emulate_terminal = emulate_terminal
 
         # Process management
         self.pid: Optional[int] = None
         self.fd: Optional[int] = None
 
+        # Event-driven PTY readiness (epoll on Linux); registered in start()
+        self._selector: Optional[selectors.BaseSelector] = None
+
+        # Background drain thread state: the thread owns all reads from the
+        # PTY and feeds the emulator, so the test thread only waits on the
+        # condition and inspects the screen under the lock
+        self._lock = threading.RLock()
+        self._data_cond = threading.Condition(self._lock)
+        self._drain_thread: Optional[threading.Thread] = None
+        self._stop_drain = False
+        self._eof = False
+        self._bytes_fed = 0
+        self._bytes_seen = 0
+        self._last_feed = 0.0
+
+        # Set when the app's first full paint is seen (READY sentinel,
+        # emitted in test mode); raw output until then is kept so a child
+        # that dies during startup can report its last words
+        self.startup_done = threading.Event()
+        self._pre_ready = bytearray()
+
         # Terminal emulation
         self.screen = pyte.Screen(width, height)
         self.stream = pyte.ByteStream(self.screen)
 
+        # Display cache: pyte rebuilds `display` from its cell buffer on
+        # every access, so remember the last rendering and reuse it until
+        # new bytes have been fed
+        self._display_dirty = True
+        self._last_lines: Optional[List[str]] = None
+        self._bytes_at_last_send = 0
+        self._last_snapshot: Optional[Snapshot] = None
+        self._last_snapshot_source: Optional[List[str]] = None
+
         # Temporary file management
         self.temp_db: Optional[str] = None
         self._cleanup_handlers = []
@@ -125,9 +304,10 @@ class DataPainterTest:
         # Track whether we created the database
         created_temp_db = False
 
-        # Create temporary database if needed
+        # Create temporary database if needed, preferring tmpfs so SQLite
+        # commits don't wait on disk
         if self.database_path is None:
-            fd, self.temp_db = tempfile.mkstemp(suffix=".db")
+            fd, self.temp_db = tempfile.mkstemp(suffix=".db", dir=scratch_db_dir())
             os.close(fd)
             self.database_path = self.temp_db
             self._cleanup_handlers.append(lambda: os.unlink(self.temp_db))
@@ -140,13 +320,27 @@ class DataPainterTest:
         # Set up environment for clean terminal
         env = os.environ.copy()
         env['TERM'] = 'xterm-256color'
+        # Unlock test-only features (e.g. the Ctrl+R state reset)
+        env['DATAPAINTER_TEST'] = '1'
+        # Scratch databases are throwaway: skip fsync, keep journal in memory
+        env['DATAPAINTER_TEST_FAST_SQLITE'] = '1'
 
-        # Fork and exec datapainter
-        self.pid, self.fd = pty.fork()
+        import fcntl
+        import struct
+        import termios
 
-        if self.pid == 0:
-            # Child process - exec datapainter
-            os.execve(
+        # Open the PTY pair and size it BEFORE the child exists. With
+        # pty.fork the size was set on the master after forking, so a
+        # child scheduled first read a 0x0 terminal and exited with
+        # "Terminal too small" — a few percent of spawns under load.
+        # posix_spawn over the pre-sized pair closes that window (and
+        # skips forking the whole interpreter just to exec).
+        master_fd, slave_fd = pty.openpty()
+        winsize = struct.pack('HHHH', self.height, self.width, 0, 0)
+        fcntl.ioctl(slave_fd, termios.TIOCSWINSZ, winsize)
+
+        try:
+            self.pid = os.posix_spawn(
                 self.datapainter_path,
                 [
                     'datapainter',
@@ -155,33 +349,59 @@ class DataPainterTest:
                     '--override-screen-height', str(self.height),
                     '--override-screen-width', str(self.width)
                 ],
-                env
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, slave_fd, 0),
+                    (os.POSIX_SPAWN_DUP2, slave_fd, 1),
+                    (os.POSIX_SPAWN_DUP2, slave_fd, 2),
+                    (os.POSIX_SPAWN_CLOSE, slave_fd),
+                    (os.POSIX_SPAWN_CLOSE, master_fd),
+                ],
+                setsid=True,
             )
-
-        # Parent process - set up terminal
-        # Set terminal window size
-        import fcntl
-        import struct
-        import termios
-
-        # Pack window size: rows, cols, xpixel, ypixel
-        winsize = struct.pack('HHHH', self.height, self.width, 0, 0)
-        fcntl.ioctl(self.fd, termios.TIOCSWINSZ, winsize)
+        finally:
+            os.close(slave_fd)
+        self.fd = master_fd
 
         # Set non-blocking mode for reading
         flags = fcntl.fcntl(self.fd, fcntl.F_GETFL)
         fcntl.fcntl(self.fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
 
-        # Wait for initial screen to render
-        # Give extra time for startup message to clear
-        time.sleep(1.0)
-        self._read_output()
+        # Register the master fd so the drain thread can block until output
+        # arrives instead of polling on a fixed sleep granularity
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.fd, selectors.EVENT_READ)
+
+        # Drain the PTY concurrently with the app's own work; the test
+        # thread only waits on the condition and reads the screen
+        self._stop_drain = False
+        self._eof = False
+        self.startup_done.clear()
+        self._pre_ready.clear()
+        self._last_feed = time.time()
+        self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self._drain_thread.start()
+
+        # Wait for the app's first full paint (READY sentinel). A child
+        # that died before painting must fail here, loudly, with its
+        # output — not 8-12 seconds later as an opaque wait_for_db or
+        # pytest-timeout failure in the test body.
+        if not self.startup_done.wait(timeout=3.0):
+            if not self.is_running():
+                output = bytes(self._pre_ready).decode('utf-8',
+                                                       errors='replace')
+                raise RuntimeError(
+                    "datapainter exited before its first paint; output:\n"
+                    + (output or "<none>"))
+            # Child alive but no sentinel (e.g. a binary predating it):
+            # fall back to the old fixed grace period
+            time.sleep(1.0)
 
     def _init_test_database(self):
         """Create a test database with a test table."""
-        import subprocess
-        subprocess.run([
-            self.datapainter_path,
+        env = os.environ.copy()
+        env['DATAPAINTER_TEST_FAST_SQLITE'] = '1'
+        run_datapainter_command(self.datapainter_path, [
             '--database', self.database_path,
             '--create-table',
             '--table', self.table_name,
@@ -194,7 +414,7 @@ class DataPainterTest:
             '--max-x', '10',
             '--min-y', '-10',
             '--max-y', '10'
-        ], check=True, capture_output=True)
+        ], env=env)
 
     def stop(self):
         """Stop datapainter process and clean up resources."""
@@ -223,6 +443,15 @@ class DataPainterTest:
                 pass
             self.pid = None
 
+        if self._drain_thread is not None:
+            self._stop_drain = True
+            self._drain_thread.join(timeout=1.0)
+            self._drain_thread = None
+
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
         if self.fd:
             try:
                 os.close(self.fd)
@@ -238,7 +467,34 @@ class DataPainterTest:
                 pass
         self._cleanup_handlers.clear()
 
-    def send_keys(self, keys: str, delay: float = 0.05):
+    def reset(self, timeout: float = 2.0) -> bool:
+        """
+        Reset the running app to its startup state (test-mode Ctrl+R).
+
+        Clears saved and unsaved points, recenters the cursor, and restores
+        the initial viewport, so a single process can be shared by several
+        tests instead of each one paying full spawn-and-render cost.
+
+        Returns:
+            True once the edit area is marker-free, False on timeout
+        """
+        if self.fd is None:
+            raise RuntimeError("Process not started")
+
+        os.write(self.fd, b'\x12')  # Ctrl+R
+
+        # The reset deletes every point, so wait until the edit area content
+        # (excluding borders, which pyte renders with ACS 'x') has no markers.
+        def edit_area_empty(lines):
+            for row in range(5, self.height - 3):
+                segment = lines[row][2:self.width - 2]
+                if any(c in segment for c in 'xoXO'):
+                    return False
+            return True
+
+        return self.wait_for_predicate(edit_area_empty, timeout=timeout)
+
+    def send_keys(self, keys, delay: float = 0.0):
         """
         Send keystrokes to datapainter.
 
@@ -246,84 +502,234 @@ class DataPainterTest:
             keys: String of keys to send. Can include special key names like
                   'TAB', 'ESC', 'UP', 'DOWN', 'LEFT', 'RIGHT', 'ENTER', 'BACKSPACE', 'DELETE'.
                   Regular characters are sent as-is.
-            delay: Delay between keys in seconds
-        """
-        # Special keys that need to be recognized as multi-character sequences
-        special_keys = ['UP', 'DOWN', 'LEFT', 'RIGHT', 'BACKSPACE', 'DELETE', 'ENTER', 'ESC', 'TAB']
-
-        i = 0
-        while i < len(keys):
-            # Check if we're at the start of a special key sequence
-            found_special = False
-            for special in special_keys:
-                if keys[i:i+len(special)] == special:
-                    self._send_key(special)
-                    i += len(special)
-                    found_special = True
-                    break
+                  Alternatively a list/tuple of key tokens. Either way the
+                  whole sequence is encoded up front and written to the PTY
+                  in a single os.write — the app consumes buffered
+                  keystrokes as fast as it can, so only the final render
+                  needs waiting on (see wait_for_idle).
+            delay: When > 0, fall back to writing one token at a time with
+                   this sleep between them (legacy pacing)
+        """
+        if self.fd is None:
+            raise RuntimeError("Process not started")
 
-            if not found_special:
-                # Regular character
-                self._send_key(keys[i])
-                i += 1
+        if isinstance(keys, (list, tuple)):
+            tokens = keys
+        else:
+            tokens = self._tokenize(keys)
 
-            time.sleep(delay)
-            self._read_output()
+        with self._data_cond:
+            self._bytes_at_last_send = self._bytes_fed
+
+        if delay > 0:
+            for token in tokens:
+                os.write(self.fd, self._encode_key(token))
+                time.sleep(delay)
+            return
+
+        os.write(self.fd, b''.join(self._encode_key(t) for t in tokens))
+
+    # Escape sequences for special key tokens
+    KEY_CODES = {
+        'UP': b'\x1b[A',
+        'DOWN': b'\x1b[B',
+        'LEFT': b'\x1b[C',
+        'RIGHT': b'\x1b[D',
+        'KEY_UP': b'\x1b[A',      # Alternative format
+        'KEY_DOWN': b'\x1b[B',    # Alternative format
+        'KEY_LEFT': b'\x1b[C',    # Alternative format
+        'KEY_RIGHT': b'\x1b[D',   # Alternative format
+        'BACKSPACE': b'\x7f',
+        'DELETE': b'\x1b[3~',
+        'ENTER': b'\r',
+        'ESC': b'\x1b',
+        'TAB': b'\t',
+    }
+
+    # Matches embedded key tokens, longest first so e.g. KEY_UP wins over UP;
+    # compiled once at class creation rather than per send_keys call
+    _TOKEN_RE = re.compile(
+        '|'.join(map(re.escape, sorted(KEY_CODES, key=len, reverse=True))))
+
+    def _tokenize(self, keys: str):
+        """Yield key tokens and literal characters from a keys string."""
+        pos = 0
+        for match in self._TOKEN_RE.finditer(keys):
+            yield from keys[pos:match.start()]
+            yield match.group(0)
+            pos = match.end()
+        yield from keys[pos:]
+
+    def _encode_key(self, key: str) -> bytes:
+        """Translate a key token (or literal text) to the bytes to write."""
+        return self.KEY_CODES.get(key, key.encode('utf-8'))
 
     def _send_key(self, key: str):
         """Send a single key to the PTY."""
         if self.fd is None:
             raise RuntimeError("Process not started")
 
-        # Handle special keys
-        key_codes = {
-            'UP': b'\x1b[A',
-            'DOWN': b'\x1b[B',
-            'LEFT': b'\x1b[C',
-            'RIGHT': b'\x1b[D',
-            'KEY_UP': b'\x1b[A',      # Alternative format
-            'KEY_DOWN': b'\x1b[B',    # Alternative format
-            'KEY_LEFT': b'\x1b[C',    # Alternative format
-            'KEY_RIGHT': b'\x1b[D',   # Alternative format
-            'BACKSPACE': b'\x7f',
-            'DELETE': b'\x1b[3~',
-            'ENTER': b'\r',
-            'ESC': b'\x1b',
-            'TAB': b'\t',
-        }
-
-        if key in key_codes:
-            os.write(self.fd, key_codes[key])
-        else:
-            os.write(self.fd, key.encode('utf-8'))
+        os.write(self.fd, self._encode_key(key))
 
-    def _read_output(self, timeout: float = 0.1):
-        """Read available output from PTY and feed to terminal emulator."""
-        if self.fd is None:
-            return
+    def _drain(self):
+        """
+        Background loop: read PTY output and feed the emulator as it arrives.
 
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            ready, _, _ = select.select([self.fd], [], [], 0.01)
-            if ready:
-                try:
-                    data = os.read(self.fd, 4096)
-                    if data:
+        Runs on its own thread so emulation overlaps with the app's compute
+        and the test thread never blocks on producer latency; every feed
+        notifies waiters on the condition. Exits on EOF (child closed its
+        end) or when stop() asks it to.
+        """
+        sentinel = b'\x1b]777;READY\x07'
+        tail = b''
+        while not self._stop_drain:
+            try:
+                if not self._selector.select(timeout=0.1):
+                    continue
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                continue
+            except OSError:
+                data = b''
+
+            # Drain whatever else is already buffered (the fd is
+            # non-blocking) so a bursty frame goes through the emulator's
+            # state machine as one feed instead of one per read
+            if data:
+                chunks = [data]
+                while True:
+                    try:
+                        more = os.read(self.fd, 65536)
+                    except (BlockingIOError, OSError):
+                        break
+                    if not more:
+                        break
+                    chunks.append(more)
+                if len(chunks) > 1:
+                    data = b''.join(chunks)
+
+            # Spot the startup sentinel in the raw bytes (keeping a tail in
+            # case it straddles two reads) before any emulation work
+            if data and not self.startup_done.is_set():
+                if len(self._pre_ready) < 4096:
+                    self._pre_ready.extend(data[:4096 - len(self._pre_ready)])
+                if sentinel in tail + data:
+                    self.startup_done.set()
+                tail = data[-(len(sentinel) - 1):]
+
+            with self._data_cond:
+                if data:
+                    if self.emulate_terminal:
                         self.stream.feed(data)
-                except OSError:
-                    break
-            else:
-                # No data available
+                    self._display_dirty = True
+                    self._bytes_fed += len(data)
+                    self._last_feed = time.time()
+                else:
+                    self._eof = True
+                self._data_cond.notify_all()
+
+            if not data:
                 break
 
+    def _read_output(self, timeout: float = 0.1) -> int:
+        """
+        Sync point with the drain thread.
+
+        Reading happens continuously in the background; this reports how
+        many bytes have been fed since the previous call, which is what
+        callers used the old synchronous read's return value for.
+        """
+        del timeout  # Kept for call compatibility
+        with self._lock:
+            new_bytes = self._bytes_fed - self._bytes_seen
+            self._bytes_seen = self._bytes_fed
+            return new_bytes
+
+    def is_running(self) -> bool:
+        """Return True while the datapainter process has not exited."""
+        if self.pid is None:
+            return False
+        try:
+            pid, _ = os.waitpid(self.pid, os.WNOHANG)
+        except (OSError, ChildProcessError):
+            self.pid = None
+            return False
+        if pid != 0:
+            # Process exited and has been reaped
+            self.pid = None
+            return False
+        return True
+
+    def is_alive_and_producing(self, min_bytes: int = 100,
+                               timeout: float = 2.0) -> bool:
+        """
+        Check that the process is running and responded to the last input.
+
+        Counts raw PTY bytes seen since the most recent send_keys call --
+        no terminal emulation involved -- so liveness-only tests can run
+        with emulate_terminal=False and still confirm the app redrew in
+        response to input rather than merely not crashing.
+
+        Args:
+            min_bytes: Output bytes required since the last send_keys
+            timeout: Maximum time to wait for them in seconds
+
+        Returns:
+            True if the process is alive and produced enough output
+        """
+        end_time = time.time() + timeout
+        with self._data_cond:
+            while self._bytes_fed - self._bytes_at_last_send < min_bytes:
+                remaining = end_time - time.time()
+                if remaining <= 0 or self._eof:
+                    return False
+                self._data_cond.wait(timeout=remaining)
+        return self.is_running()
+
+    def wait_for_exit(self, timeout: float = 2.0) -> bool:
+        """
+        Wait for the datapainter process to exit.
+
+        Blocks on the reader thread's condition until it sees EOF on the
+        PTY master (the child closing its side of the terminal), then
+        polls waitpid briefly for the actual reap. Event-driven, so a
+        clean quit returns in milliseconds instead of a fixed sleep.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the process exited within the timeout
+        """
+        end_time = time.time() + timeout
+        with self._data_cond:
+            while not self._eof:
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    break
+                self._data_cond.wait(timeout=remaining)
+        while self.is_running():
+            if time.time() >= end_time:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _require_emulation(self):
+        """Raise if a screen accessor is used without terminal emulation."""
+        if not self.emulate_terminal:
+            raise RuntimeError(
+                "Screen state is not available with emulate_terminal=False; "
+                "use wait_for_idle/is_running or database checks instead")
+
     def get_screen(self) -> pyte.Screen:
         """
         Get current screen state.
 
         Returns:
-            pyte.Screen object with current display
+            pyte.Screen object with current display (live: the drain thread
+            keeps feeding it while the app produces output)
         """
-        self._read_output()
+        self._require_emulation()
         return self.screen
 
     def get_display_lines(self) -> List[str]:
@@ -333,8 +739,122 @@ class DataPainterTest:
         Returns:
             List of strings, one for each row
         """
-        self._read_output()
-        return [self.screen.display[row] for row in range(self.height)]
+        self._require_emulation()
+        with self._lock:
+            if self._display_dirty or self._last_lines is None:
+                if self._last_lines is not None:
+                    # pyte tracks which rows each feed touched in
+                    # screen.dirty; re-render just those instead of joining
+                    # the full display. A fresh list keeps lines already
+                    # handed to callers immutable.
+                    lines = list(self._last_lines)
+                    for y in self.screen.dirty:
+                        if y < self.height:
+                            lines[y] = self._render_row(y)
+                    self._last_lines = lines
+                else:
+                    self._last_lines = list(self.screen.display)
+                self.screen.dirty.clear()
+                self._display_dirty = False
+                # Invariant checked once per rebuilt frame so individual
+                # tests need not re-verify it line by line
+                assert max(map(len, self._last_lines)) <= self.width, \
+                    "Emulated screen produced a line wider than the terminal"
+            return self._last_lines
+
+    def _render_row(self, y: int) -> str:
+        """Render one display row from pyte's sparse cell buffer."""
+        row = self.screen.buffer.get(y)
+        if not row:
+            return ' ' * self.width
+        return ''.join(row[x].data if x in row else ' '
+                       for x in range(self.width))
+
+    def count_chars_in_region(self, chars: str, rows: slice, cols: slice) -> int:
+        """
+        Count occurrences of any of `chars` in a rectangular screen region.
+
+        Walks pyte's cell buffer directly. The buffer is a sparse defaultdict
+        that only holds cells that have been written, so on a mostly-empty
+        screen this touches far fewer cells than slicing and joining display
+        rows, and it allocates no intermediate strings.
+
+        Args:
+            chars: Characters to count (e.g. 'xX' for single/multiple points)
+            rows: Row range as a slice (0-based, stop exclusive)
+            cols: Column range as a slice (0-based, stop exclusive)
+
+        Returns:
+            Total number of matching cells in the region
+        """
+        self._require_emulation()
+        wanted = set(chars)
+        row_start, row_stop, _ = rows.indices(self.height)
+        col_start, col_stop, _ = cols.indices(self.width)
+
+        with self._lock:
+            count = 0
+            buffer = self.screen.buffer
+            for y in range(row_start, row_stop):
+                if y not in buffer:
+                    continue
+                for x, cell in buffer[y].items():
+                    if col_start <= x < col_stop and cell.data in wanted:
+                        count += 1
+            return count
+
+    def any_char(self, chars: str) -> bool:
+        """
+        Check whether any of `chars` appears anywhere on the screen.
+
+        Like count_chars_in_region this walks pyte's sparse cell buffer, but
+        it short-circuits on the first hit, so an "is it on screen at all"
+        assertion touches only the handful of written cells instead of
+        rendering all width x height display rows.
+
+        Args:
+            chars: Characters to look for (e.g. 'xX' for any x point)
+
+        Returns:
+            True if at least one matching cell exists
+        """
+        self._require_emulation()
+        wanted = set(chars)
+
+        with self._lock:
+            for row in self.screen.buffer.values():
+                for cell in row.values():
+                    if cell.data in wanted:
+                        return True
+            return False
+
+    def snapshot(self) -> Snapshot:
+        """
+        Capture the screen once as a frozen Snapshot.
+
+        Computes the display a single time and derives the joined text and
+        the edit-area content from it, so an assertion block can probe all
+        three without re-walking pyte's buffer. Take a fresh snapshot after
+        any send_keys or wait_* call.
+
+        Returns:
+            Snapshot with `lines` (tuple of rows), `text` (rows joined with
+            newlines) and `middle` (edit-area rows, borders excluded)
+        """
+        with self._lock:
+            # get_display_lines returns the same list object until the
+            # screen changes, so identity tells us the cached Snapshot is
+            # still current and repeated calls on an idle screen are free.
+            source = self.get_display_lines()
+            if self._last_snapshot_source is source:
+                return self._last_snapshot
+            lines = tuple(source)
+            middle = '\n'.join(
+                line[2:self.width - 2] for line in lines[5:self.height - 3])
+            self._last_snapshot = Snapshot(
+                lines=lines, text='\n'.join(lines), middle=middle)
+            self._last_snapshot_source = source
+            return self._last_snapshot
 
     def get_cell(self, row: int, col: int) -> str:
         """
@@ -347,8 +867,237 @@ class DataPainterTest:
         Returns:
             Character at position
         """
-        self._read_output()
-        return self.screen.display[row][col]
+        return self.get_display_lines()[row][col]
+
+    def wait_for_predicate(self, predicate, timeout: float = 2.0,
+                           interval: float = 0.01) -> bool:
+        """
+        Wait until a predicate over the display lines becomes true.
+
+        Event-driven: between checks the call waits on the drain thread's
+        condition, which is notified on every feed, so it wakes within a
+        scheduler quantum of the app producing output rather than at a
+        fixed sleep granularity. The screen can only change when output
+        arrives, so no periodic re-check is needed.
+
+        Args:
+            predicate: Callable taking the list of display lines, returning
+                       True when the awaited condition holds
+            timeout: Maximum time to wait in seconds
+            interval: Kept for call compatibility; waits end when output
+                      arrives
+
+        Returns:
+            True if the predicate became true, False if timeout
+        """
+        del interval
+        end_time = time.time() + timeout
+        with self._data_cond:
+            while True:
+                if predicate(self.get_display_lines()):
+                    return True
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    return False
+                self._data_cond.wait(timeout=remaining)
+
+    def wait_for_screen_change(self, prev: Snapshot, timeout: float = 2.0) -> bool:
+        """
+        Wait until the display differs from a previously captured snapshot.
+
+        Useful after keys whose effect has no single characteristic glyph
+        (zoom, pan): take a snapshot, send the keys, then block here until
+        any cell changes.
+
+        Args:
+            prev: Snapshot taken before the keys were sent
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the screen changed, False on timeout
+        """
+        return self.wait_for_predicate(
+            lambda lines: tuple(lines) != prev.lines, timeout=timeout)
+
+    def wait_for_frame(self, assertion, timeout: float = 2.0) -> None:
+        """
+        Wait until an assertion over the display lines stops raising.
+
+        Like wait_for_predicate, but for callables that assert rather than
+        return a bool. On timeout the assertion runs one final time outside
+        the retry loop so its own failure message reaches the test report
+        instead of a generic one.
+
+        Args:
+            assertion: Callable taking the list of display lines; raises
+                       AssertionError while the awaited frame has not arrived
+            timeout: Maximum time to wait in seconds
+        """
+        def passes(lines) -> bool:
+            try:
+                assertion(lines)
+                return True
+            except AssertionError:
+                return False
+
+        if not self.wait_for_predicate(passes, timeout=timeout):
+            assertion(self.get_display_lines())
+
+    def wait_for_idle(self, idle: float = 0.03, timeout: float = 1.0) -> bool:
+        """
+        Wait until the app stops producing output.
+
+        Useful after a batched send_keys call: the app redraws once per
+        buffered keystroke, and the screen is final once output goes quiet.
+
+        Args:
+            idle: How long output must stay silent to count as idle
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True once output was silent for `idle` seconds, False if timeout
+        """
+        start_time = time.time()
+        end_time = start_time + timeout
+        with self._data_cond:
+            while True:
+                if self._eof:
+                    # The child closed its end: no further output is coming
+                    return True
+                # Quiet time counts from this call at the earliest, so a
+                # send_keys immediately before can't satisfy the idle window
+                # with silence that predates it
+                quiet_for = time.time() - max(self._last_feed, start_time)
+                if quiet_for >= idle:
+                    return True
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    return False
+                self._data_cond.wait(timeout=min(idle - quiet_for, remaining))
+
+    def press_and_wait_for(self, keys, chars: str, timeout: float = 5.0):
+        """
+        Send keys and wait until any of `chars` renders in the edit area.
+
+        One call for the suite's most common pattern — press a key, then
+        assert its marker appears — with no fixed sleep. The edit area
+        excludes borders and labels, so point markers can't be confused
+        with the ACS border glyphs. The wait is event-driven, so the
+        generous default timeout costs nothing when the marker appears
+        promptly; it only delays the report of a genuine failure.
+
+        Args:
+            keys: Keys to send (string or token list, as for send_keys)
+            chars: Characters of which at least one must appear
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            AssertionError: If none of `chars` appeared before the timeout
+        """
+        self.send_keys(keys)
+        wanted = set(chars)
+
+        def marker_visible(lines):
+            return any(
+                wanted.intersection(line[2:self.width - 2])
+                for line in lines[5:self.height - 3])
+
+        if not self.wait_for_predicate(marker_visible, timeout=timeout):
+            raise AssertionError(
+                f"None of {chars!r} appeared in the edit area "
+                f"after sending {keys!r}")
+
+    def assert_stable(self, expected_text: str = 'test_table',
+                      min_rows: int = 20, msg: str = "",
+                      timeout: float = 2.0):
+        """
+        Assert the UI is fully rendered and still shows `expected_text`.
+
+        One call for the suite's common closing check — a full-height
+        frame that still carries the table name. Both checks scan a
+        single fetched frame; if that frame happens to be mid-repaint
+        (e.g. right after a database-state wait, which can resolve
+        before the header redraws), the check retries until the next
+        frames arrive rather than failing on a transient.
+
+        Args:
+            expected_text: Text that must appear somewhere on screen
+            min_rows: Minimum number of display rows expected
+            msg: Optional context prefixed to the failure message
+            timeout: How long a mid-repaint frame may take to settle
+
+        Raises:
+            AssertionError: If no qualifying frame appeared in time
+        """
+        def stable(lines):
+            return (len(lines) >= min_rows
+                    and any(expected_text in line for line in lines))
+
+        if self.wait_for_predicate(stable, timeout=timeout):
+            return
+        lines = self.get_display_lines()
+        detail = f"{msg}: " if msg else ""
+        raise AssertionError(
+            f"{detail}expected at least {min_rows} display rows containing "
+            f"{expected_text!r}, got {len(lines)} rows without it")
+
+    def send_keys_and_wait(self, keys, predicate, timeout: float = 2.0) -> bool:
+        """
+        Send keys and wait until a predicate over this test becomes true.
+
+        The counterpart of press_and_wait_for for effects that are not a
+        glyph in the edit area — a row appearing in unsaved_changes, the
+        display diverging from a captured snapshot, and so on. The
+        predicate receives this DataPainterTest instance; every keypress
+        that changes state also triggers a redraw, so the wait wakes on
+        the resulting output rather than polling at a fixed interval.
+
+        Args:
+            keys: Keys to send (string or token list, as for send_keys)
+            predicate: Callable taking this test instance, returning True
+                       when the awaited effect is visible
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the predicate became true, False on timeout
+        """
+        self.send_keys(keys)
+        return self.wait_for_predicate(lambda _lines: predicate(self),
+                                       timeout=timeout)
+
+    def wait_ready(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for the app's first full paint (test-mode READY sentinel).
+
+        start() already waits for this, so tests normally see it set; the
+        method exists for callers that start the process by other means or
+        want an explicit check instead of waiting for rendered text.
+
+        Returns:
+            True once the sentinel has been seen, False on timeout
+        """
+        return self.startup_done.wait(timeout=timeout)
+
+    def contains(self, text: str) -> bool:
+        """
+        Return True if `text` appears in any display line.
+
+        Short-circuits on the first matching row and never joins the
+        display into one big string, so it pairs well with the cached
+        renderer for cheap repeated checks. Only finds text within a
+        single row; nothing the tests look for spans rows.
+        """
+        return any(text in line for line in self.get_display_lines())
+
+    def contains_in_rows(self, text: str, start: int, stop: int) -> bool:
+        """
+        Return True if `text` appears in any display row in [start, stop).
+
+        Same early-exit row scan as contains, restricted to a band of rows
+        (e.g. the three header rows) so callers need not slice and join.
+        """
+        return any(text in line
+                   for line in self.get_display_lines()[start:stop])
 
     def wait_for_text(self, text: str, timeout: float = 2.0) -> bool:
         """
@@ -361,14 +1110,9 @@ class DataPainterTest:
         Returns:
             True if text appeared, False if timeout
         """
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            self._read_output()
-            display = '\n'.join(self.get_display_lines())
-            if text in display:
-                return True
-            time.sleep(0.05)
-        return False
+        return self.wait_for_predicate(
+            lambda lines: any(text in line for line in lines),
+            timeout=timeout)
 
     def assert_char_at(self, row: int, col: int, expected: str, msg: str = ""):
         """
@@ -398,8 +1142,10 @@ class DataPainterTest:
             text: Text to search for
             msg: Optional error message
         """
-        display = '\n'.join(self.get_display_lines())
-        if text not in display:
+        if not self.contains(text):
+            # Only build the joined screen dump on the failure path; the
+            # happy path is a per-row scan with no allocation
+            display = '\n'.join(self.get_display_lines())
             error_msg = (
                 f"{msg}\n" if msg else "" +
                 f"Expected text '{text}' not found in screen\n"
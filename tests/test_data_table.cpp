@@ -61,6 +61,22 @@ TEST_F(DataTableTest, DeleteNonExistentPointFails) {
     EXPECT_FALSE(data_table->delete_point(99999));
 }
 
+// Test deleting all points
+TEST_F(DataTableTest, DeleteAllPoints) {
+    ASSERT_TRUE(data_table->insert_point(1.0, 2.0, "x").has_value());
+    ASSERT_TRUE(data_table->insert_point(3.0, 4.0, "o").has_value());
+
+    EXPECT_TRUE(data_table->delete_all_points());
+
+    auto points = data_table->query_viewport(-10.0, 10.0, -10.0, 10.0);
+    EXPECT_TRUE(points.empty());
+}
+
+// Test deleting all points on an empty table succeeds
+TEST_F(DataTableTest, DeleteAllPointsEmptyTable) {
+    EXPECT_TRUE(data_table->delete_all_points());
+}
+
 // Test updating point target
 TEST_F(DataTableTest, UpdatePointTarget) {
     auto id = data_table->insert_point(1.0, 2.0, "x");
@@ -1,5 +1,6 @@
 #include <gtest/gtest.h>
 #include "database.h"
+#include <cstdlib>
 #include <filesystem>
 #include <fstream>
 
@@ -129,3 +130,57 @@ TEST(DatabaseTest, ConnectionReturnsNullForClosedDatabase) {
     sqlite3* conn = db.connection();
     EXPECT_EQ(conn, nullptr);
 }
+
+// Helper: read a single-value pragma as text
+static std::string query_pragma(Database& db, const std::string& pragma) {
+    sqlite3_stmt* stmt = nullptr;
+    std::string sql = "PRAGMA " + pragma;
+    if (sqlite3_prepare_v2(db.connection(), sql.c_str(), -1, &stmt, nullptr) != SQLITE_OK) {
+        return "";
+    }
+    std::string value;
+    if (sqlite3_step(stmt) == SQLITE_ROW) {
+        value = reinterpret_cast<const char*>(sqlite3_column_text(stmt, 0));
+    }
+    sqlite3_finalize(stmt);
+    return value;
+}
+
+// Test that DATAPAINTER_TEST_FAST_SQLITE applies the fast pragmas
+TEST(DatabaseTest, FastSqliteEnvVarAppliesPragmas) {
+    const std::string test_db = "test_fast_pragmas.db";
+    if (std::filesystem::exists(test_db)) {
+        std::filesystem::remove(test_db);
+    }
+
+    setenv("DATAPAINTER_TEST_FAST_SQLITE", "1", 1);
+    {
+        Database db(test_db);
+        unsetenv("DATAPAINTER_TEST_FAST_SQLITE");
+        ASSERT_TRUE(db.is_open());
+
+        EXPECT_EQ(query_pragma(db, "synchronous"), "0");  // 0 == OFF
+        EXPECT_EQ(query_pragma(db, "journal_mode"), "memory");
+    }
+
+    std::filesystem::remove(test_db);
+}
+
+// Test that the fast pragmas are not applied without the env var
+TEST(DatabaseTest, FastSqlitePragmasOffByDefault) {
+    const std::string test_db = "test_default_pragmas.db";
+    if (std::filesystem::exists(test_db)) {
+        std::filesystem::remove(test_db);
+    }
+
+    unsetenv("DATAPAINTER_TEST_FAST_SQLITE");
+    {
+        Database db(test_db);
+        ASSERT_TRUE(db.is_open());
+
+        EXPECT_NE(query_pragma(db, "synchronous"), "0");
+        EXPECT_NE(query_pragma(db, "journal_mode"), "memory");
+    }
+
+    std::filesystem::remove(test_db);
+}